@@ -1,33 +1,83 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+import json
 import os
 import re
 import sys
 import urllib.parse
+from functools import lru_cache
 from logging import getLogger
-from typing import Any, Dict, List
+from typing import Any, Container, Dict, List, Optional, Sequence, Set, Tuple
 
 import click
 
+from ..config import config_file
 from ..exceptions import DeadlineOperationError
 
 logger = getLogger(__name__)
 
 __all__ = [
+    "split_web_url",
     "parse_query_string",
+    "get_best_profile_for_farm_cached",
     "install_deadline_web_url_handler",
     "uninstall_deadline_web_url_handler",
     "DEADLINE_URL_SCHEME_NAME",
 ]
 
 DEADLINE_URL_SCHEME_NAME = "deadline"
-DEADLINE_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
-DEADLINE_TASK_ID_PATTERN = re.compile(r"^[0-9a-f]{32}-(0|([1-9][0-9]{0,9}))$")
 VALID_RESOURCE_NAMES_IN_ID = ["farm", "queue", "job", "step", "task"]
+# Matches "<resource type>-<32 hex digits>", where task IDs additionally end with "-<task index>"
+DEADLINE_RESOURCE_ID_PATTERN = re.compile(
+    rf"(?P<resource_type>{'|'.join(VALID_RESOURCE_NAMES_IN_ID)})-[0-9a-f]{{32}}"
+    r"(?P<task_index>-(?:0|[1-9][0-9]{0,9}))?"
+)
+# File name, next to the AWS Deadline Cloud config file, where web URL profile lookups are persisted
+WEB_URL_PROFILE_CACHE_FILE_NAME = "web_url_profile_cache.json"
+
+
+def split_web_url(url: str) -> Tuple[str, str, str]:
+    """
+    Splits a web URL into its (scheme, netloc, query string) parts.
+
+    A deadline:// URL has the form deadline://<command>?<query>, so this
+    only looks for the "://", "?" and "#" delimiters instead of running the full
+    parser in urllib.parse.urlsplit. As with urlsplit, surrounding whitespace
+    and any tab or newline characters are removed first. The scheme is
+    lower-cased, and any path or fragment is dropped. A URL without "://" only
+    reports its scheme.
+
+    Args:
+        url (str): The web URL to split.
+    """
+    url = url.strip()
+    if "\t" in url or "\r" in url or "\n" in url:
+        url = url.replace("\t", "").replace("\r", "").replace("\n", "")
+    scheme, separator, rest = url.partition("://")
+    if not separator:
+        scheme, separator, _ = url.partition(":")
+        return (scheme.lower() if separator else ""), "", ""
+    if "#" in rest:
+        rest = rest.partition("#")[0]
+    if "?" in rest:
+        location, _, query_string = rest.partition("?")
+    else:
+        location, query_string = rest, ""
+    return scheme.lower(), location.partition("/")[0], query_string
+
+
+def _unquote_plus(value: str) -> str:
+    """
+    Same as urllib.parse.unquote_plus, but returns the value directly when
+    there is nothing to decode, as is the case for resource IDs.
+    """
+    if "%" not in value and "+" not in value:
+        return value
+    return urllib.parse.unquote_plus(value)
 
 
 def parse_query_string(
-    query_string: str, parameter_names: List[str], required_parameter_names: List[str]
+    query_string: str, parameter_names: Sequence[str], required_parameter_names: Sequence[str]
 ) -> Dict[str, str]:
     """
     Parses the URL query string into {"parameter": "value"} form.
@@ -37,40 +87,53 @@ def parse_query_string(
     Args:
         query_string (str): The query string from a parsed web URL.
     """
-    result: dict = {}
+    parsed_qs: Dict[str, str] = {}
+    duplicate_names: Set[str] = set()
 
+    # A single pass over the "&"-separated fields. Like urllib.parse.parse_qs with
+    # strict_parsing=True, fields without "=" are errors and fields with blank values
+    # are dropped, but no lists of values are built.
     if query_string:
-        parsed_qs = urllib.parse.parse_qs(query_string, strict_parsing=True)
-    else:
-        parsed_qs = {}
+        for field in query_string.split("&"):
+            name, separator, value = field.partition("=")
+            if not separator:
+                raise DeadlineOperationError(f"The URL query contained a malformed field {field!r}")
+            if not value:
+                continue
+            name = _unquote_plus(name)
+            if name in parsed_qs:
+                duplicate_names.add(name)
+            else:
+                parsed_qs[name] = _unquote_plus(value)
 
     # Ensure the required parameters are provided
-    missing_required_parameters = set(required_parameter_names) - set(parsed_qs.keys())
+    missing_required_parameters = set(required_parameter_names) - parsed_qs.keys()
     if missing_required_parameters:
         raise DeadlineOperationError(
             f"The URL query did not contain the required parameter(s) {list(missing_required_parameters)}"
         )
 
     # Process all the valid parameter names
+    result: Dict[str, str] = {}
     for name in parameter_names:
-        values = parsed_qs.pop(name, None)
-        if values:
-            if len(values) > 1:
+        parameter_value = parsed_qs.pop(name, None)
+        if parameter_value is not None:
+            if name in duplicate_names:
                 raise DeadlineOperationError(
                     f"The URL query parameter {name} was provided multiple times, it may only be provided once."
                 )
-            result[name.replace("-", "_")] = values[0]
+            result[name.replace("-", "_")] = parameter_value
 
     # If there are any left, they are not valid
     if parsed_qs:
         raise DeadlineOperationError(
-            f"The URL query contained unsupported parameter names {parsed_qs.keys()}"
+            f"The URL query contained unsupported parameter names {list(parsed_qs.keys())}"
         )
 
     return result
 
 
-def validate_resource_ids(ids: Dict[str, str]) -> None:
+def validate_resource_ids(ids: Dict[str, str], *, exclude: Container[str] = ()) -> None:
     """
     Validates that the resource IDs are all valid.
     i.e. "<name of resource>-<a hexadecimal string of length 32>"
@@ -79,15 +142,32 @@ def validate_resource_ids(ids: Dict[str, str]) -> None:
     Args:
         ids (Dict[str, str]): The resource IDs to validate.
         Expected to be {"<resource type>_id": "<full id string>"} form.
+        exclude (Container[str]): Keys of `ids` that are not resource IDs, and are skipped.
     """
     for id_name, id_str in ids.items():
-        resource_type = id_str.split("-")[0]
-        if not id_name.startswith(resource_type) or not validate_id_format(resource_type, id_str):
+        if id_name in exclude:
+            continue
+        resource_type = _match_resource_id(id_str)
+        if resource_type is None or not id_name.startswith(resource_type):
             raise DeadlineOperationError(
                 f'The given resource ID "{id_name}": "{id_str}" has invalid format.'
             )
 
 
+def _match_resource_id(full_id_str: str) -> Optional[str]:
+    """
+    Returns the resource type of the ID if it is in a valid format, otherwise None.
+    """
+    match = DEADLINE_RESOURCE_ID_PATTERN.fullmatch(full_id_str)
+    if match is None:
+        return None
+    resource_type = match.group("resource_type")
+    # Only task IDs, and all task IDs, have the trailing task index
+    if (resource_type == "task") != (match.group("task_index") is not None):
+        return None
+    return resource_type
+
+
 def validate_id_format(resource_type: str, full_id_str: str) -> bool:
     """
     Validates if the ID is in correct format. The ID must
@@ -100,21 +180,88 @@ def validate_id_format(resource_type: str, full_id_str: str) -> bool:
         full_id_str (str): The ID to validate.
         resource_type (str): "farm", "queue", "job", etc.
     """
-    if resource_type not in VALID_RESOURCE_NAMES_IN_ID:
-        return False
+    return _match_resource_id(full_id_str) == resource_type
 
-    prefix = f"{resource_type}-"
-    if not full_id_str.startswith(prefix):
-        return False
 
-    id_str = full_id_str[len(prefix) :]
+def _get_profile_lookup_file_stamps() -> Tuple[Tuple[str, Optional[int]], ...]:
+    """
+    Returns the (path, mtime_ns) pairs of every file the best profile lookup
+    depends on. If any of them change, previously cached lookups are invalid.
+    """
+    paths = [
+        str(config_file.get_config_file_path()),
+        os.path.expanduser(
+            os.environ.get("AWS_CONFIG_FILE") or os.path.join("~", ".aws", "config")
+        ),
+        os.path.expanduser(
+            os.environ.get("AWS_SHARED_CREDENTIALS_FILE")
+            or os.path.join("~", ".aws", "credentials")
+        ),
+    ]
+    stamps: List[Tuple[str, Optional[int]]] = []
+    for path in paths:
+        try:
+            stamps.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            stamps.append((path, None))
+    return tuple(stamps)
 
-    if resource_type == "task":
-        return bool(DEADLINE_TASK_ID_PATTERN.fullmatch(id_str))
-    else:
-        if len(id_str) != 32:
-            return False
-        return bool(DEADLINE_ID_PATTERN.fullmatch(id_str))
+
+@lru_cache(maxsize=64)
+def _cached_best_profile(
+    farm_id: str, queue_id: str, file_stamps: Tuple[Tuple[str, Optional[int]], ...]
+) -> str:
+    """
+    Looks up the best AWS profile for the farm and queue, using the on-disk
+    cache file when it was written for the same config file modification times.
+    """
+    cache_file_path = config_file.get_config_file_path().parent / WEB_URL_PROFILE_CACHE_FILE_NAME
+    lookup_key = f"{farm_id}/{queue_id}"
+    stamps_json = [list(stamp) for stamp in file_stamps]
+
+    cache_contents: Any = None
+    try:
+        with open(cache_file_path, encoding="utf8") as fh:
+            cache_contents = json.load(fh)
+    except (OSError, ValueError):
+        pass
+
+    # A missing or malformed cache file is the same as an empty one
+    profiles: Dict[str, str] = {}
+    if isinstance(cache_contents, dict) and cache_contents.get("file_stamps") == stamps_json:
+        cached_profiles = cache_contents.get("profiles")
+        if isinstance(cached_profiles, dict):
+            profiles = cached_profiles
+
+    cached_profile = profiles.get(lookup_key)
+    if isinstance(cached_profile, str):
+        return cached_profile
+
+    aws_profile_name = config_file.get_best_profile_for_farm(farm_id, queue_id)
+
+    profiles[lookup_key] = aws_profile_name
+    try:
+        with open(cache_file_path, "w", encoding="utf8") as fh:
+            json.dump({"file_stamps": stamps_json, "profiles": profiles}, fh)
+    except OSError as e:
+        logger.debug(f"Failed to write the web URL profile cache {cache_file_path}: {e}")
+
+    return aws_profile_name
+
+
+def get_best_profile_for_farm_cached(farm_id: str, queue_id: str) -> str:
+    """
+    Returns the same value as `config_file.get_best_profile_for_farm`, but
+    caches the result both in memory and in a file next to the AWS Deadline Cloud
+    config, keyed on the modification times of the config files it reads. Each web
+    URL is handled by a new process, so the file cache is what avoids scanning
+    every AWS profile for repeated clicks.
+
+    Args:
+        farm_id (str): The farm ID from the web URL.
+        queue_id (str): The queue ID from the web URL.
+    """
+    return _cached_best_profile(farm_id, queue_id, _get_profile_lookup_file_stamps())
 
 
 def install_deadline_web_url_handler(all_users: bool) -> None:
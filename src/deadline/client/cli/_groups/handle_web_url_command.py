@@ -5,7 +5,7 @@ The `deadline handle-web-url` command.
 """
 
 import sys
-import urllib
+from typing import Callable, Dict
 
 import click
 
@@ -18,13 +18,66 @@ from .._common import (
 )
 from .._deadline_web_url import (
     DEADLINE_URL_SCHEME_NAME,
+    get_best_profile_for_farm_cached,
     install_deadline_web_url_handler,
     parse_query_string,
+    split_web_url,
     uninstall_deadline_web_url_handler,
     validate_resource_ids,
 )
 from .job_group import _download_job_output
 
+_INSTALL_HELP = f"Install this CLI command as the {DEADLINE_URL_SCHEME_NAME}:// URL handler"
+_UNINSTALL_HELP = f"Uninstall this CLI command as the {DEADLINE_URL_SCHEME_NAME}:// URL handler"
+
+_DOWNLOAD_OUTPUT_PARAMETER_NAMES = (
+    "farm-id",
+    "queue-id",
+    "job-id",
+    "step-id",
+    "task-id",
+    "profile",
+)
+_DOWNLOAD_OUTPUT_REQUIRED_PARAMETER_NAMES = ("farm-id", "queue-id", "job-id")
+
+
+def _handle_download_output(query_string: str) -> None:
+    """
+    Handles the deadline://download-output command.
+    """
+    url_queries = parse_query_string(
+        query_string,
+        parameter_names=_DOWNLOAD_OUTPUT_PARAMETER_NAMES,
+        required_parameter_names=_DOWNLOAD_OUTPUT_REQUIRED_PARAMETER_NAMES,
+    )
+
+    # Validate the IDs, skipping the 'profile' key as that isn't a resource ID
+    validate_resource_ids(url_queries, exclude=("profile",))
+
+    farm_id = url_queries["farm_id"]
+    queue_id = url_queries["queue_id"]
+    job_id = url_queries["job_id"]
+    step_id = url_queries.get("step_id")
+    task_id = url_queries.get("task_id")
+
+    # Use the AWS profile provided by the url (set by Deadline Cloud monitor),
+    # or choose a best guess based on farm and queue IDs
+    aws_profile_name = url_queries.get("profile") or get_best_profile_for_farm_cached(
+        farm_id, queue_id
+    )
+
+    # Read the config, and switch the in-memory version to use the chosen AWS profile
+    config = config_file.read_config()
+    config_file.set_setting("defaults.aws_profile_name", aws_profile_name, config=config)
+
+    _download_job_output(config, farm_id, queue_id, job_id, step_id, task_id)
+
+
+# The commands that handle-web-url accepts, mapped to the function that handles each one.
+_WEB_URL_COMMANDS: Dict[str, Callable[[str], None]] = {
+    "download-output": _handle_download_output,
+}
+
 
 @click.command(name="handle-web-url")
 @click.argument("url", required=False)
@@ -38,13 +91,13 @@ from .job_group import _download_job_output
     "--install",
     default=False,
     is_flag=True,
-    help=f"Install this CLI command as the {DEADLINE_URL_SCHEME_NAME}:// URL handler",
+    help=_INSTALL_HELP,
 )
 @click.option(
     "--uninstall",
     default=False,
     is_flag=True,
-    help=f"Uninstall this CLI command as the {DEADLINE_URL_SCHEME_NAME}:// URL handler",
+    help=_UNINSTALL_HELP,
 )
 @click.option(
     "--all-users",
@@ -88,47 +141,20 @@ def cli_handle_web_url(
                 "The --install, --uninstall and --all-users options cannot be used with a provided URL."
             )
 
-        split_url = urllib.parse.urlsplit(url)
+        scheme, command, query_string = split_web_url(url)
 
-        if split_url.scheme != DEADLINE_URL_SCHEME_NAME:
+        if scheme != DEADLINE_URL_SCHEME_NAME:
             raise DeadlineOperationError(
-                f"URL scheme {split_url.scheme} is not supported. Only {DEADLINE_URL_SCHEME_NAME} is supported."
+                f"URL scheme {scheme} is not supported. Only {DEADLINE_URL_SCHEME_NAME} is supported."
             )
 
-        # Validate that the command is supp
-        if split_url.netloc == "download-output":
-            url_queries = parse_query_string(
-                split_url.query,
-                parameter_names=["farm-id", "queue-id", "job-id", "step-id", "task-id", "profile"],
-                required_parameter_names=["farm-id", "queue-id", "job-id"],
-            )
-
-            # Validate the IDs
-            # We copy the dict without the 'profile' key as that isn't a resource ID
-            validate_resource_ids({k: url_queries[k] for k in url_queries.keys() - {"profile"}})
-
-            farm_id = url_queries.pop("farm_id")
-            queue_id = url_queries.pop("queue_id")
-            job_id = url_queries.pop("job_id")
-            step_id = url_queries.pop("step_id", None)
-            task_id = url_queries.pop("task_id", None)
-
-            # Add the standard option "profile", using the one provided by the url (set by Deadline Cloud monitor)
-            # or choosing a best guess based on farm and queue IDs
-            aws_profile_name = url_queries.pop(
-                "profile",
-                config_file.get_best_profile_for_farm(farm_id, queue_id),
-            )
-
-            # Read the config, and switch the in-memory version to use the chosen AWS profile
-            config = config_file.read_config()
-            config_file.set_setting("defaults.aws_profile_name", aws_profile_name, config=config)
-
-            _download_job_output(config, farm_id, queue_id, job_id, step_id, task_id)
-        else:
+        # Validate that the command is supported
+        handler = _WEB_URL_COMMANDS.get(command)
+        if handler is None:
             raise DeadlineOperationError(
-                f"Command {split_url.netloc} is not supported through handle-web-url.",
+                f"Command {command} is not supported through handle-web-url.",
             )
+        handler(query_string)
     elif install and uninstall:
         raise DeadlineOperationError(
             "Only one of the --install and --uninstall options may be provided."
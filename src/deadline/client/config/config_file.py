@@ -454,7 +454,7 @@ def get_best_profile_for_farm(farm_id: str, queue_id: Optional[str] = None) -> s
     config.read_dict(read_config())
 
     # (For 1.) Save the default profile and return it if its default farm matches.
-    default_aws_profile_name: str = str(get_setting("defaults.aws_profile_name", config=config))
+    default_aws_profile_name = get_setting("defaults.aws_profile_name", config=config)
     if get_setting("defaults.farm_id", config=config) == farm_id:
         return default_aws_profile_name
 
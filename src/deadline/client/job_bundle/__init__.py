@@ -26,7 +26,7 @@ def create_job_history_bundle_dir(submitter_name: str, job_name: str) -> str:
     The directory will look like
       <job_history_dir>/YYYY-mm/YYYY-mm-ddTHH-##-<submitter_name>-<job_name>
     """
-    job_history_dir = str(get_setting("settings.job_history_dir"))
+    job_history_dir = get_setting("settings.job_history_dir")
     job_history_dir = os.path.expanduser(job_history_dir)
 
     # Clean the submitter_name's characters
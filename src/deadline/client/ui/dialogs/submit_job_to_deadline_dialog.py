@@ -6,9 +6,10 @@ from __future__ import annotations
 import logging
 import os
 import sys
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 
-from qtpy.QtCore import QSize, Qt  # pylint: disable=import-error
+from qtpy.QtCore import QEventLoop, QSize, Qt  # pylint: disable=import-error
 from qtpy.QtGui import QKeyEvent  # pylint: disable=import-error
 from qtpy.QtWidgets import (  # pylint: disable=import-error; type: ignore
     QApplication,
@@ -23,7 +24,6 @@ from qtpy.QtWidgets import (  # pylint: disable=import-error; type: ignore
     QWidget,
 )
 
-from deadline.client.ui.dialogs.submit_job_progress_dialog import SubmitJobProgressDialog
 from deadline.job_attachments.models import JobAttachmentS3Settings
 from deadline.job_attachments.upload import S3AssetManager
 
@@ -31,7 +31,7 @@ from ... import api
 from ..deadline_authentication_status import DeadlineAuthenticationStatus
 from .. import block_signals
 from ...config import get_setting
-from ...config.config_file import str2bool
+from ...config.config_file import read_config, str2bool
 from ...exceptions import UserInitiatedCancel
 from ...job_bundle import create_job_history_bundle_dir
 from ...job_bundle.submission import AssetReferences
@@ -47,6 +47,30 @@ logger = logging.getLogger(__name__)
 # initialize early so once the UI opens, things are already initialized
 DeadlineAuthenticationStatus.getInstance()
 
+# How long, in seconds, a deadline:GetQueue response is reused by later submissions to the same queue
+GET_QUEUE_CACHE_SECONDS = 60
+# Maps (farm_id, queue_id) to (get_queue response, time.monotonic() of the call)
+_get_queue_cache: Dict[Tuple[str, str], Tuple[Dict[str, Any], float]] = {}
+
+
+def _get_queue_cached(deadline, farm_id: str, queue_id: str) -> Dict[str, Any]:
+    """
+    Calls deadline:GetQueue, reusing the response from a previous call for the
+    same farm and queue if it was made within GET_QUEUE_CACHE_SECONDS.
+    """
+    now = time.monotonic()
+    cached = _get_queue_cache.get((farm_id, queue_id))
+    if cached is not None and now - cached[1] < GET_QUEUE_CACHE_SECONDS:
+        return cached[0]
+
+    queue = deadline.get_queue(farmId=farm_id, queueId=queue_id)
+    _get_queue_cache[(farm_id, queue_id)] = (queue, now)
+    return queue
+
+
+def _invalidate_get_queue_cache() -> None:
+    _get_queue_cache.clear()
+
 
 class SubmitJobToDeadlineDialog(QDialog):
     """
@@ -191,10 +215,12 @@ class SubmitJobToDeadlineDialog(QDialog):
     def _set_submit_button_state(self):
         # Enable/disable the Submit button based on whether the
         # AWS Deadline Cloud API is accessible and the farm+queue are configured.
+        # This runs on every authentication status refresh, so check the config file once.
+        config = read_config()
         enable = (
             self.deadline_authentication_status.api_availability is True
-            and get_setting("defaults.farm_id") != ""
-            and get_setting("defaults.queue_id") != ""
+            and get_setting("defaults.farm_id", config=config) != ""
+            and get_setting("defaults.queue_id", config=config) != ""
             and self.shared_job_settings.is_queue_valid()
         )
 
@@ -210,19 +236,18 @@ class SubmitJobToDeadlineDialog(QDialog):
     def refresh_deadline_settings(self):
         # Enable/disable the Login and Logout buttons based on whether
         # the configured profile is for Deadline Cloud monitor
-        self.login_button.setEnabled(
-            self.deadline_authentication_status.creds_source
-            == api.AwsCredentialsSource.DEADLINE_CLOUD_MONITOR_LOGIN
-        )
-        self.logout_button.setEnabled(
-            self.deadline_authentication_status.creds_source
+        authentication_status = self.deadline_authentication_status
+        is_monitor_login = (
+            authentication_status.creds_source
             == api.AwsCredentialsSource.DEADLINE_CLOUD_MONITOR_LOGIN
         )
+        self.login_button.setEnabled(is_monitor_login)
+        self.logout_button.setEnabled(is_monitor_login)
 
         self._set_submit_button_state()
 
         self.shared_job_settings.deadline_cloud_settings_box.refresh_setting_controls(
-            self.deadline_authentication_status.api_availability is True
+            authentication_status.api_availability is True
         )
         # If necessary, this reloads the queue parameters
         self.shared_job_settings.refresh_queue_parameters()
@@ -247,7 +272,6 @@ class SubmitJobToDeadlineDialog(QDialog):
         self.shared_job_settings.parameter_changed.connect(self.on_shared_job_parameter_changed)
         self.shared_job_settings_tab.setWidget(self.shared_job_settings)
         self.shared_job_settings_tab.setWidgetResizable(True)
-        self.shared_job_settings.parameter_changed.connect(self.on_shared_job_parameter_changed)
 
     def _build_job_settings_tab(self, job_setup_widget_type, initial_job_settings):
         self.job_settings_tab = QScrollArea()
@@ -313,6 +337,7 @@ class SubmitJobToDeadlineDialog(QDialog):
 
     def on_login(self):
         DeadlineLoginDialog.login(parent=self)
+        _invalidate_get_queue_cache()
         self.refresh_deadline_settings()
         # This widget watches the auth files, but that does
         # not always catch a change so force a refresh here.
@@ -320,6 +345,7 @@ class SubmitJobToDeadlineDialog(QDialog):
 
     def on_logout(self):
         api.logout()
+        _invalidate_get_queue_cache()
         self.refresh_deadline_settings()
         # This widget watches the auth files, but that does
         # not always catch a change so force a refresh here.
@@ -327,16 +353,24 @@ class SubmitJobToDeadlineDialog(QDialog):
 
     def on_settings_button_clicked(self):
         if DeadlineConfigDialog.configure_settings(parent=self):
+            # The settings may now point to a different AWS profile
+            _invalidate_get_queue_cache()
             self.refresh_deadline_settings()
 
-    def on_export_bundle(self):
+    def _get_job_settings(self):
         """
-        Exports a Job Bundle, but does not submit the job.
+        Returns a new job settings dataclass, with all the settings retrieved from the UI.
         """
-        # Retrieve all the settings into the dataclass
         settings = self.job_settings_type()
         self.shared_job_settings.update_settings(settings)
         self.job_settings.update_settings(settings)
+        return settings
+
+    def on_export_bundle(self):
+        """
+        Exports a Job Bundle, but does not submit the job.
+        """
+        settings = self._get_job_settings()
 
         queue_parameters = self.shared_job_settings.get_parameters()
 
@@ -393,18 +427,23 @@ class SubmitJobToDeadlineDialog(QDialog):
         # Unset any cached response
         self.create_job_response = None
 
-        # Retrieve all the settings into the dataclass
-        settings = self.job_settings_type()
-        self.shared_job_settings.update_settings(settings)
-        self.job_settings.update_settings(settings)
+        settings = self._get_job_settings()
 
         queue_parameters = self.shared_job_settings.get_parameters()
 
         asset_references = self.job_attachments.get_asset_references()
 
+        # Only the progress dialog module itself is deferred here; the job attachments
+        # and api modules it uses are already loaded through `api`.
+        from .submit_job_progress_dialog import SubmitJobProgressDialog
+
         job_progress_dialog = SubmitJobProgressDialog(parent=self)
         job_progress_dialog.show()
-        QApplication.instance().processEvents()  # type: ignore[union-attr]
+        # Paint the progress dialog before the submission work starts, but don't process
+        # user input, such as another click on Submit, in the middle of on_submit.
+        QApplication.instance().processEvents(  # type: ignore[union-attr]
+            QEventLoop.ExcludeUserInputEvents
+        )
 
         # Submit the job
         try:
@@ -436,9 +475,10 @@ class SubmitJobToDeadlineDialog(QDialog):
                     purpose=JobBundlePurpose.SUBMISSION,
                 )
 
-            farm_id = get_setting("defaults.farm_id")
-            queue_id = get_setting("defaults.queue_id")
-            storage_profile_id = get_setting("settings.storage_profile_id")
+            config = read_config()
+            farm_id = get_setting("defaults.farm_id", config=config)
+            queue_id = get_setting("defaults.queue_id", config=config)
+            storage_profile_id = get_setting("settings.storage_profile_id", config=config)
 
             storage_profile = None
             if storage_profile_id:
@@ -446,7 +486,7 @@ class SubmitJobToDeadlineDialog(QDialog):
                     farm_id, queue_id, storage_profile_id, deadline
                 )
 
-            queue = deadline.get_queue(farmId=farm_id, queueId=queue_id)
+            queue = _get_queue_cached(deadline, farm_id, queue_id)
 
             queue_role_session = api.get_queue_user_boto3_session(
                 deadline=deadline,
@@ -482,7 +522,7 @@ class SubmitJobToDeadlineDialog(QDialog):
                 queue_parameters,
                 asset_manager,
                 deadline,
-                auto_accept=str2bool(get_setting("settings.auto_accept")),
+                auto_accept=str2bool(get_setting("settings.auto_accept", config=config)),
                 require_paths_exist=self.job_attachments.get_require_paths_exist(),
             )
         except UserInitiatedCancel as uic:
@@ -4,13 +4,15 @@
 tests the deadline.client.api functions relating to queues
 """
 
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
 from unittest.mock import patch
 
 import pytest
 
 from deadline.client import api
 
-QUEUES_LIST = [
+_QUEUES_DATA = [
     {
         "queueId": "queue-0123456789abcdef0123456789abcdef",
         "description": "",
@@ -39,29 +41,44 @@ QUEUES_LIST = [
 ]
 
 
-def test_list_queues_paginated(fresh_deadline_config):
+@pytest.fixture(scope="session")
+def queues_list() -> Tuple[Mapping[str, Any], ...]:
+    """Read-only queues, shared by all the tests in the session."""
+    return tuple(MappingProxyType(queue) for queue in _QUEUES_DATA)
+
+
+@pytest.fixture(scope="session")
+def queues_pages(queues_list) -> Tuple[Tuple[Mapping[str, Any], ...], ...]:
+    """The queues split into the pages returned by a paginated list_queues."""
+    return (queues_list[:2], queues_list[2:3], queues_list[3:])
+
+
+def test_list_queues_paginated(fresh_deadline_config, queues_list, queues_pages):
     """Confirm api.list_queues concatenates multiple pages"""
     with patch.object(api._session, "get_boto3_session") as session_mock:
+        # The responses get lists, because the API extends the first page in place
         session_mock().client("deadline").list_queues.side_effect = [
-            {"queues": QUEUES_LIST[:2], "nextToken": "abc"},
-            {"queues": QUEUES_LIST[2:3], "nextToken": "def"},
-            {"queues": QUEUES_LIST[3:]},
+            {"queues": list(queues_pages[0]), "nextToken": "abc"},
+            {"queues": list(queues_pages[1]), "nextToken": "def"},
+            {"queues": list(queues_pages[2])},
         ]
 
         # Call the API
         queues = api.list_queues()
 
-        assert queues["queues"] == QUEUES_LIST
+        assert queues["queues"] == list(queues_list)
 
 
 @pytest.mark.parametrize("pass_principal_id_filter", [True, False])
 @pytest.mark.parametrize("user_identities", [True, False])
-def test_list_queues_principal_id(fresh_deadline_config, pass_principal_id_filter, user_identities):
+def test_list_queues_principal_id(
+    fresh_deadline_config, queues_list, pass_principal_id_filter, user_identities
+):
     """Confirm api.list_queues sets the principalId parameter appropriately"""
 
     with patch.object(api._session, "get_boto3_session") as session_mock:
         session_mock().client("deadline").list_queues.side_effect = [
-            {"queues": QUEUES_LIST},
+            {"queues": list(queues_list)},
         ]
         if user_identities:
             session_mock()._session.get_scoped_config.return_value = {
@@ -76,7 +93,7 @@ def test_list_queues_principal_id(fresh_deadline_config, pass_principal_id_filte
         else:
             queues = api.list_queues()
 
-        assert queues["queues"] == QUEUES_LIST
+        assert queues["queues"] == list(queues_list)
 
         if pass_principal_id_filter:
             session_mock().client("deadline").list_queues.assert_called_once_with(
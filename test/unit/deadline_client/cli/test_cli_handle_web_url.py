@@ -3,6 +3,7 @@
 """
 Tests for the CLI handle-web-url command.
 """
+import json
 import os
 import sys
 from typing import Dict, List
@@ -13,12 +14,16 @@ from click.testing import CliRunner
 
 from deadline.client import api
 from deadline.client.cli import main
+from deadline.client.cli import _deadline_web_url
 from deadline.client.cli._deadline_web_url import (
+    get_best_profile_for_farm_cached,
     parse_query_string,
+    split_web_url,
     validate_id_format,
     validate_resource_ids,
 )
 from deadline.client.cli._groups import handle_web_url_command, job_group
+from deadline.client.config import config_file
 from deadline.client.exceptions import DeadlineOperationError
 from deadline.job_attachments.models import (
     FileConflictResolution,
@@ -39,6 +44,36 @@ from ..shared_constants import (
 )
 
 
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("deadline://download-output?a=b&c=d", ("deadline", "download-output", "a=b&c=d")),
+        ("DEADLINE://download-output/?a=b#frag", ("deadline", "download-output", "a=b")),
+        ("deadline://config", ("deadline", "config", "")),
+        ("https://sketchy-website.com", ("https", "sketchy-website.com", "")),
+        ("not-a-url", ("", "", "")),
+        (" deadline://config\n", ("deadline", "config", "")),
+        ("deadline://download-\toutput?a=b\r\n", ("deadline", "download-output", "a=b")),
+        ("deadline:download-output?a=b", ("deadline", "", "")),
+        (
+            f"deadline://download-output?farm-id={MOCK_FARM_ID}&queue-id={MOCK_QUEUE_ID}",
+            ("deadline", "download-output", f"farm-id={MOCK_FARM_ID}&queue-id={MOCK_QUEUE_ID}"),
+        ),
+        (
+            f"deadline://download-output/?profile={MOCK_PROFILE_NAME}",
+            ("deadline", "download-output", f"profile={MOCK_PROFILE_NAME}"),
+        ),
+        ("deadline://", ("deadline", "", "")),
+        ("https://sketchy-website.com/path?query=1", ("https", "sketchy-website.com", "query=1")),
+    ],
+)
+def test_split_web_url(url: str, expected: tuple):
+    """
+    Tests splitting web URLs into scheme, netloc, and query string.
+    """
+    assert split_web_url(url) == expected
+
+
 def test_parse_query_string():
     """
     A few successful test cases.
@@ -54,6 +89,22 @@ def test_parse_query_string():
     }
 
 
+def test_parse_query_string_decoding():
+    """
+    Tests that values are percent-decoded, and blank values are treated as not provided.
+    """
+    assert parse_query_string("a=b%2Fc+d&c=", ["a", "c"], ["a"]) == {"a": "b/c d"}
+
+
+def test_parse_query_string_malformed():
+    """
+    Tests with fields that are not in name=value form
+    """
+    with pytest.raises(DeadlineOperationError) as excinfo:
+        parse_query_string("a=b&c", ["a", "c"], ["a"])
+    assert "malformed field 'c'" in str(excinfo)
+
+
 def test_parse_query_string_missing_required():
     """
     Tests with missing required parameters
@@ -143,6 +194,17 @@ def test_validate_resource_ids_successful(ids: Dict[str, str]):
     validate_resource_ids(ids)
 
 
+def test_validate_resource_ids_exclude():
+    """
+    Tests that excluded keys are not validated as resource IDs.
+    """
+    validate_resource_ids(
+        {"farm_id": MOCK_FARM_ID, "profile": MOCK_PROFILE_NAME}, exclude=("profile",)
+    )
+    with pytest.raises(DeadlineOperationError):
+        validate_resource_ids({"farm_id": MOCK_FARM_ID, "profile": MOCK_PROFILE_NAME})
+
+
 @pytest.mark.parametrize(
     ("ids", "exception_message"),
     [
@@ -235,6 +297,7 @@ def test_validate_id_format_successful(resource_type: str, full_id_str: str):
         ("farm", "farm-0123456789abcdefabcdefabcdezxvzx"),
         ("farm", "farm-0123456789abcdefabcdefabcde!@#$%"),
         ("farm", "farm-0123456789abcdefabcdefabcdefabcd00000"),
+        ("farm", "farm-0123456789abcdefabcdefabcdefabcd-1"),
         ("farm", "queue-0123456789abcdefabcdefabcdefabcd"),
         ("farmfarm", "farmfarm-0123456789abcdefabcdefabcdefabcd"),
         ("mission", "mission-0123456789abcdefabcdefabcdefabcd"),
@@ -250,6 +313,69 @@ def test_validate_id_format_failed(resource_type: str, full_id_str: str):
     assert not validate_id_format(resource_type, full_id_str)
 
 
+def test_get_best_profile_for_farm_cached(fresh_deadline_config):
+    """
+    Tests that the best profile lookup is cached in memory and on disk, and
+    that the cache is invalidated when the config file changes.
+    """
+    _deadline_web_url._cached_best_profile.cache_clear()
+    with patch.object(
+        config_file, "get_best_profile_for_farm", return_value=MOCK_PROFILE_NAME
+    ) as mock_get_best_profile:
+        assert get_best_profile_for_farm_cached(MOCK_FARM_ID, MOCK_QUEUE_ID) == MOCK_PROFILE_NAME
+        assert get_best_profile_for_farm_cached(MOCK_FARM_ID, MOCK_QUEUE_ID) == MOCK_PROFILE_NAME
+        mock_get_best_profile.assert_called_once_with(MOCK_FARM_ID, MOCK_QUEUE_ID)
+
+        # A new process starts with an empty in-memory cache, and reads the cache file
+        _deadline_web_url._cached_best_profile.cache_clear()
+        assert get_best_profile_for_farm_cached(MOCK_FARM_ID, MOCK_QUEUE_ID) == MOCK_PROFILE_NAME
+        mock_get_best_profile.assert_called_once()
+
+        # Modifying the config file invalidates both caches
+        config_stat = os.stat(fresh_deadline_config)
+        os.utime(fresh_deadline_config, ns=(config_stat.st_atime_ns, config_stat.st_mtime_ns + 1))
+        _deadline_web_url._cached_best_profile.cache_clear()
+        assert get_best_profile_for_farm_cached(MOCK_FARM_ID, MOCK_QUEUE_ID) == MOCK_PROFILE_NAME
+        assert mock_get_best_profile.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "cache_contents",
+    [
+        "not json",
+        "[]",
+        '{"file_stamps": null, "profiles": {}}',
+        '{"file_stamps": FILE_STAMPS, "profiles": []}',
+        '{"file_stamps": FILE_STAMPS, "profiles": {"PROFILE_KEY": 7}}',
+    ],
+)
+def test_get_best_profile_for_farm_cached_malformed_file(fresh_deadline_config, cache_contents):
+    """
+    Tests that a malformed cache file is treated as empty and then rewritten.
+    """
+    stamps_json = [list(stamp) for stamp in _deadline_web_url._get_profile_lookup_file_stamps()]
+    cache_contents = cache_contents.replace("FILE_STAMPS", json.dumps(stamps_json)).replace(
+        "PROFILE_KEY", f"{MOCK_FARM_ID}/{MOCK_QUEUE_ID}"
+    )
+    cache_file_path = (
+        config_file.get_config_file_path().parent
+        / _deadline_web_url.WEB_URL_PROFILE_CACHE_FILE_NAME
+    )
+    cache_file_path.write_text(cache_contents, encoding="utf8")
+
+    _deadline_web_url._cached_best_profile.cache_clear()
+    with patch.object(
+        config_file, "get_best_profile_for_farm", return_value=MOCK_PROFILE_NAME
+    ) as mock_get_best_profile:
+        assert get_best_profile_for_farm_cached(MOCK_FARM_ID, MOCK_QUEUE_ID) == MOCK_PROFILE_NAME
+        mock_get_best_profile.assert_called_once_with(MOCK_FARM_ID, MOCK_QUEUE_ID)
+
+    assert json.loads(cache_file_path.read_text(encoding="utf8")) == {
+        "file_stamps": stamps_json,
+        "profiles": {f"{MOCK_FARM_ID}/{MOCK_QUEUE_ID}": MOCK_PROFILE_NAME},
+    }
+
+
 def test_cli_handle_web_url_download_output_only_required_input(fresh_deadline_config):
     """
     Confirm that the CLI interface prints out the expected list of
@@ -308,7 +434,9 @@ def test_cli_handle_web_url_download_output_with_optional_input(fresh_deadline_c
         job_group, "OutputDownloader"
     ) as MockOutputDownloader, patch.object(job_group, "round", return_value=0), patch.object(
         api, "get_queue_user_boto3_session"
-    ):
+    ), patch.object(
+        config_file, "get_best_profile_for_farm"
+    ) as mock_get_best_profile:
         mock_download = MagicMock()
         MockOutputDownloader.return_value.download_job_output = mock_download
         mock_host_path_format_name = PathFormat.get_host_path_format_string()
@@ -335,6 +463,8 @@ def test_cli_handle_web_url_download_output_with_optional_input(fresh_deadline_c
         runner = CliRunner()
         result = runner.invoke(main, ["handle-web-url", web_url])
         assert result.exit_code == 0, result.output
+        # The profile from the URL is used without scanning the AWS profiles
+        mock_get_best_profile.assert_not_called()
 
         MockOutputDownloader.assert_called_once_with(
             s3_settings=JobAttachmentS3Settings(**MOCK_GET_QUEUE_RESPONSE["jobAttachmentSettings"]),  # type: ignore